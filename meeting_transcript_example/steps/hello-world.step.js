@@ -46,7 +46,10 @@ exports.handler = async (context) => {
         status: item.status,
         progress: item.progress,
         timestamp: item.timestamp,
-        whisperModel: item.whisperModel
+        whisperModel: item.whisperModel,
+        localWhisperStatus: item.localWhisperStatus,
+        // Only the summarizer's final update carries a summary
+        hasSummary: Boolean(item.summary)
       })),
       endpoints: {
         'GET /hello-world': 'Live system dashboard (you are here)',
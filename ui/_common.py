@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the Motia Streamlit UIs
+
+Streamlit puts the running script's directory on sys.path, so both
+meetings_ui.py and ocr_ui.py import this module as `_common`.
+"""
+
+import pandas as pd
+import streamlit as st
+
+@st.cache_resource
+def inject_css(css: str):
+    """Inject a stylesheet, built once per process
+
+    Streamlit records the markdown element on the first call and replays it on
+    cache hits, so the style stays applied on every rerun.
+    """
+    st.markdown(css, unsafe_allow_html=True)
+
+def get_upload_details(uploaded_files):
+    """File details table for the uploads, rebuilt only when the uploads change"""
+    upload_key = tuple((file.name, file.size) for file in uploaded_files)
+    if st.session_state.get('upload_key') != upload_key:
+        # Built column-wise so pandas skips the row pivot
+        st.session_state.upload_key = upload_key
+        st.session_state.upload_details = pd.DataFrame({
+            "Name": [file.name for file in uploaded_files],
+            "Size": [f"{file.size / 1048576:.1f} MB" for file in uploaded_files],
+            "Type": [file.type for file in uploaded_files]
+        })
+    return st.session_state.upload_details
@@ -9,18 +9,30 @@ Enhanced with real-time Motia backend integration showcasing:
 """
 
 import streamlit as st
-import subprocess
-import os
 import pandas as pd
 import time
-from pathlib import Path
-import json
-from datetime import datetime
+import html
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from _common import get_upload_details, inject_css
 
 # Motia backend configuration
 MOTIA_BASE_URL = "http://localhost:3000"
+# (connect, read) timeouts in seconds: fail fast when the backend is down,
+# but give a running backend time to answer
+MOTIA_STATUS_TIMEOUT = (1, 5)
+MOTIA_SUBMIT_TIMEOUT = (1, 10)
+
+# Fixed column layout for the recent activity table (fields of /hello-world recentActivity)
+RECENT_ACTIVITY_COLUMNS = {
+    "filename": st.column_config.TextColumn("File", width="medium"),
+    "status": st.column_config.TextColumn("Status", width="small"),
+    "progress": st.column_config.ProgressColumn("Progress", min_value=0, max_value=100, format="%d%%"),
+    "timestamp": st.column_config.TextColumn("Time", width="small"),
+    "whisperModel": st.column_config.TextColumn("Model", width="small"),
+    "localWhisperStatus": st.column_config.TextColumn("Whisper", width="medium")
+}
 
 # Page configuration
 st.set_page_config(
@@ -31,7 +43,7 @@ st.set_page_config(
 )
 
 # Custom CSS for modern, clean styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -44,6 +56,7 @@ st.markdown("""
     }
     .metric-card {
         background: white;
+        color: #262730;
         padding: 1.5rem;
         border-radius: 12px;
         box-shadow: 0 4px 12px rgba(0,0,0,0.1);
@@ -128,18 +141,60 @@ st.markdown("""
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-def get_motia_status():
+@st.cache_resource
+def get_http_session():
+    """Shared HTTP session so Motia calls reuse keep-alive connections"""
+    session = requests.Session()
+    # Failed connects are retried for every method, including the POST, since
+    # the request never reached the backend. Read errors are retried once, for
+    # idempotent methods (GET) only: that covers a keep-alive connection the
+    # backend closed between polls, while a hung backend costs at most two
+    # read timeouts per poll
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, connect=2, read=1, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def fetch_motia_status():
     """Get live status from Motia backend"""
     try:
-        response = requests.get(f"{MOTIA_BASE_URL}/hello-world", timeout=5)
+        response = get_http_session().get(f"{MOTIA_BASE_URL}/hello-world", timeout=MOTIA_STATUS_TIMEOUT)
         if response.status_code == 200:
             return response.json()
         return None
     except:
         return None
 
+@st.cache_data(ttl=5, show_spinner=False)
+def get_motia_status():
+    """Get Motia status, shared by all sessions for 5 seconds
+
+    Activity timestamps are reformatted for display here, so they are parsed
+    once per fetch rather than on every dashboard refresh.
+    """
+    status_data = fetch_motia_status()
+    activity = status_data.get('recentActivity') if status_data else None
+    if activity:
+        # Motia stamps records with Date.toISOString(); the ISO8601 fast path
+        # parses them all in C instead of inferring a format per value
+        display_times = pd.to_datetime(
+            [item.get('timestamp') for item in activity], format='ISO8601', utc=True
+        ).strftime('%H:%M:%S')
+        for item, display_time in zip(activity, display_times):
+            item['timestamp'] = display_time
+    return status_data
+
+@st.cache_data(ttl=2, show_spinner=False)
+def probe_motia_status():
+    """Fresh Motia status for the test button; clicks within 2 seconds share one request"""
+    return fetch_motia_status()
+
 def start_transcription_via_motia(filename: str, audio_data: bytes = None):
     """Start transcription using Motia API"""
     try:
@@ -149,10 +204,10 @@ def start_transcription_via_motia(filename: str, audio_data: bytes = None):
             "model": "whisper-large-v3"
         }
         
-        response = requests.post(
+        response = get_http_session().post(
             f"{MOTIA_BASE_URL}/transcribe-meeting",
             json=payload,
-            timeout=10
+            timeout=MOTIA_SUBMIT_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -162,29 +217,32 @@ def start_transcription_via_motia(filename: str, audio_data: bytes = None):
         st.error(f"Failed to start transcription: {e}")
         return None
 
+@st.fragment(run_every="5s")
 def display_motia_dashboard():
-    """Display live Motia system status"""
+    """Display live Motia system status
+
+    Runs as a fragment that refreshes itself every 5 seconds, so polling the
+    backend reruns only this section instead of the whole page.
+    """
     st.subheader("🔗 Live Motia Backend Status")
     
-    # Get status with auto-refresh
-    if 'last_refresh' not in st.session_state:
-        st.session_state.last_refresh = 0
+    # Status is shared across sessions for 5 seconds; let users force a fetch
+    if st.button("🔄 Refresh", key="refresh_motia_status"):
+        get_motia_status.clear()
     
-    current_time = time.time()
-    if current_time - st.session_state.last_refresh > 5:  # Refresh every 5 seconds
-        st.session_state.motia_status = get_motia_status()
-        st.session_state.last_refresh = current_time
-    
-    status_data = st.session_state.get('motia_status')
+    status_data = get_motia_status()
     
     if status_data:
+        stats = status_data.get('stats') or {}
+        activity = status_data.get('recentActivity')
+        features = status_data.get('features') or {}
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.metric("System Status", "🟢 Healthy", "Connected to Motia")
         
         with col2:
-            stats = status_data.get('stats', {})
             st.metric("Total Transcriptions", stats.get('totalTranscriptions', 0))
         
         with col3:
@@ -195,15 +253,19 @@ def display_motia_dashboard():
             st.metric("Uptime", f"{uptime:.0f}s")
         
         # Recent activity
-        if status_data.get('recentActivity'):
+        if activity:
             st.subheader("📊 Recent Transcription Activity")
-            df = pd.DataFrame(status_data['recentActivity'])
-            df['timestamp'] = pd.to_datetime(df['timestamp']).dt.strftime('%H:%M:%S')
-            st.dataframe(df, use_container_width=True)
+            st.dataframe(
+                pd.DataFrame(activity),
+                use_container_width=True,
+                hide_index=True,
+                column_config=RECENT_ACTIVITY_COLUMNS,
+                # Only the configured columns; hasSummary is for the progress view
+                column_order=list(RECENT_ACTIVITY_COLUMNS)
+            )
         
         # Features showcase
         st.subheader("✨ Motia Features in Action")
-        features = status_data.get('features', {})
         for feature, status in features.items():
             st.write(f"{status} **{feature}**")
     
@@ -211,6 +273,103 @@ def display_motia_dashboard():
         st.error("🔴 Cannot connect to Motia backend at http://localhost:3000")
         st.info("Make sure to run: `cd meeting_transcript_example && npx motia dev`")
 
+# HTML card templates for the summary tabs, filled with str.format
+ACTION_ITEM_CARD = (
+    '<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); '
+    'color: white; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; '
+    'border-left: 4px solid #4CAF50;"><strong>#{index}</strong> {item}</div>'
+)
+KEY_TOPIC_CARD = (
+    '<div style="background: #f8f9fa; border: 2px solid #667eea; padding: 1rem; '
+    'border-radius: 8px; text-align: center; margin: 0.5rem 0;">'
+    '<strong>{topic}</strong></div>'
+)
+DECISION_CARD = (
+    '<div style="background: #fff3cd; border: 1px solid #ffeaa7; padding: 1rem; '
+    'border-radius: 8px; margin: 0.5rem 0; border-left: 4px solid #f39c12;">'
+    '<strong>Decision #{index}:</strong> {decision}</div>'
+)
+METRIC_ROW = '<div style="display: flex; gap: 0.5rem;">{cards}</div>'
+METRIC_CARD = (
+    '<div class="metric-card" style="flex: 1;">'
+    '<div style="color: #666; font-size: 0.85rem;">{label}</div>'
+    '<div style="font-size: 1.6rem; font-weight: 600;">{value}</div>{delta}</div>'
+)
+METRIC_DELTA = '<div style="color: #2e7d32; font-size: 0.85rem;">{delta}</div>'
+
+def render_metric_cards(metrics):
+    """Render (label, value[, delta]) tuples as one row of cards in a single element"""
+    cards = []
+    for label, value, *delta in metrics:
+        cards.append(METRIC_CARD.format(
+            label=html.escape(label),
+            value=html.escape(str(value)),
+            delta=METRIC_DELTA.format(delta=html.escape(delta[0])) if delta else ""
+        ))
+    st.markdown(METRIC_ROW.format(cards="".join(cards)), unsafe_allow_html=True)
+
+@st.cache_resource
+def get_mock_summary_data():
+    """Demo analysis results, built once per process and shared read-only"""
+    return {
+        'summary': """
+📋 **Meeting Summary:**
+This 15-minute team standup meeting covered project progress and upcoming milestones. The team discussed current sprint status, identified blockers, and planned next steps for the product launch.
+
+🎯 **Key Outcomes:**
+• Sprint progress is on track with 80% completion
+• Two technical blockers identified and assigned
+• Product launch timeline confirmed for next month
+• Team coordination improved with new processes
+
+💡 **Overall Assessment:**
+The meeting was highly productive with clear action items and strong team engagement.
+        """,
+        'actionItems': [
+            'John: Resolve database performance issue by Friday',
+            'Sarah: Complete user testing scenarios by Tuesday', 
+            'Mike: Update deployment scripts by Thursday',
+            'Team: Review final designs in tomorrow\'s meeting'
+        ],
+        'keyTopics': [
+            'Project Management',
+            'Technology',
+            'Team Coordination',
+            'Quality Assurance'
+        ],
+        'sentimentAnalysis': {
+            'overall': 'positive',
+            'confidence': 0.85,
+            'positiveIndicators': 8,
+            'negativeIndicators': 2,
+            'energyLevel': 'high'
+        },
+        'decisions': [
+            'Approved moving to production deployment next Friday',
+            'Agreed to implement new code review process',
+            'Decided to add two more testing scenarios'
+        ],
+        'insights': {
+            'participationScore': 9,
+            'engagementLevel': 'high',
+            'meetingEfficiency': 'high',
+            'followUpNeeded': True,
+            'keyMetrics': {
+                'wordCount': 2456,
+                'estimatedSpeakingRate': 165,
+                'participantCount': 4
+            }
+        }
+    }
+
+@st.cache_data(show_spinner=False)
+def get_sentiment_chart_data(positive: int, negative: int) -> pd.DataFrame:
+    """Sentiment breakdown as a small DataFrame, cached per indicator pair"""
+    return pd.DataFrame(
+        {'Indicators': [positive, negative]},
+        index=['Positive Indicators', 'Negative Indicators']
+    )
+
 def display_comprehensive_summary(summary_data):
     """Display comprehensive meeting summary with all AI insights"""
     if not summary_data:
@@ -235,40 +394,24 @@ def display_comprehensive_summary(summary_data):
     with tab1:
         if summary_data.get('actionItems'):
             st.subheader("Action Items Extracted")
-            for i, item in enumerate(summary_data['actionItems'], 1):
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 1rem;
-                    border-radius: 8px;
-                    margin: 0.5rem 0;
-                    border-left: 4px solid #4CAF50;
-                ">
-                    <strong>#{i}</strong> {item}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(
+                ACTION_ITEM_CARD.format(index=i, item=html.escape(item))
+                for i, item in enumerate(summary_data['actionItems'], 1)
+            ), unsafe_allow_html=True)
         else:
             st.info("No action items identified in this meeting")
     
     with tab2:
         if summary_data.get('keyTopics'):
             st.subheader("Key Topics Discussed")
-            cols = st.columns(min(3, len(summary_data['keyTopics'])))
-            for i, topic in enumerate(summary_data['keyTopics']):
-                with cols[i % 3]:
-                    st.markdown(f"""
-                    <div style="
-                        background: #f8f9fa;
-                        border: 2px solid #667eea;
-                        padding: 1rem;
-                        border-radius: 8px;
-                        text-align: center;
-                        margin: 0.5rem 0;
-                    ">
-                        <strong>{topic}</strong>
-                    </div>
-                    """, unsafe_allow_html=True)
+            topics = summary_data['keyTopics']
+            cols = st.columns(min(3, len(topics)))
+            # One markdown call per column: topics are dealt round-robin as before
+            for col_index, col in enumerate(cols):
+                col.markdown("".join(
+                    KEY_TOPIC_CARD.format(topic=html.escape(topic))
+                    for topic in topics[col_index::3]
+                ), unsafe_allow_html=True)
         else:
             st.info("No specific topics identified")
     
@@ -276,54 +419,37 @@ def display_comprehensive_summary(summary_data):
         if summary_data.get('sentimentAnalysis'):
             sentiment = summary_data['sentimentAnalysis']
             
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                # Overall sentiment with emoji
-                sentiment_emoji = {
-                    'positive': '😊',
-                    'negative': '😔', 
-                    'neutral': '😐'
-                }
-                st.metric(
-                    "Overall Sentiment", 
-                    f"{sentiment_emoji.get(sentiment['overall'], '😐')} {sentiment['overall'].title()}",
-                    f"{sentiment['confidence']:.1%} confidence"
-                )
-            
-            with col2:
-                st.metric("Energy Level", sentiment.get('energyLevel', 'medium').title())
-            
-            with col3:
-                net_sentiment = sentiment.get('positiveIndicators', 0) - sentiment.get('negativeIndicators', 0)
-                st.metric("Sentiment Balance", f"+{net_sentiment}" if net_sentiment > 0 else str(net_sentiment))
+            # Overall sentiment with emoji
+            sentiment_emoji = {
+                'positive': '😊',
+                'negative': '😔', 
+                'neutral': '😐'
+            }
+            net_sentiment = sentiment.get('positiveIndicators', 0) - sentiment.get('negativeIndicators', 0)
+            render_metric_cards([
+                ("Overall Sentiment",
+                 f"{sentiment_emoji.get(sentiment['overall'], '😐')} {sentiment['overall'].title()}",
+                 f"{sentiment['confidence']:.1%} confidence"),
+                ("Energy Level", sentiment.get('energyLevel', 'medium').title()),
+                ("Sentiment Balance", f"+{net_sentiment}" if net_sentiment > 0 else str(net_sentiment))
+            ])
                 
             # Sentiment breakdown chart
             st.subheader("Sentiment Breakdown")
-            sentiment_data = {
-                'Positive Indicators': sentiment.get('positiveIndicators', 0),
-                'Negative Indicators': sentiment.get('negativeIndicators', 0)
-            }
-            st.bar_chart(sentiment_data)
+            st.bar_chart(get_sentiment_chart_data(
+                sentiment.get('positiveIndicators', 0),
+                sentiment.get('negativeIndicators', 0)
+            ))
         else:
             st.info("Sentiment analysis not available")
     
     with tab4:
         if summary_data.get('decisions'):
             st.subheader("Key Decisions Made")
-            for i, decision in enumerate(summary_data['decisions'], 1):
-                st.markdown(f"""
-                <div style="
-                    background: #fff3cd;
-                    border: 1px solid #ffeaa7;
-                    padding: 1rem;
-                    border-radius: 8px;
-                    margin: 0.5rem 0;
-                    border-left: 4px solid #f39c12;
-                ">
-                    <strong>Decision #{i}:</strong> {decision}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(
+                DECISION_CARD.format(index=i, decision=html.escape(decision))
+                for i, decision in enumerate(summary_data['decisions'], 1)
+            ), unsafe_allow_html=True)
         else:
             st.info("No specific decisions identified")
     
@@ -333,100 +459,139 @@ def display_comprehensive_summary(summary_data):
             
             # Key metrics
             st.subheader("Meeting Analytics")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric(
-                    "Participation Score", 
-                    f"{insights.get('participationScore', 0)}/10"
-                )
-            
-            with col2:
-                engagement = insights.get('engagementLevel', 'medium')
-                engagement_emoji = {'high': '🔥', 'medium': '📊', 'low': '📉'}
-                st.metric(
-                    "Engagement", 
-                    f"{engagement_emoji.get(engagement)} {engagement.title()}"
-                )
-            
-            with col3:
-                efficiency = insights.get('meetingEfficiency', 'medium')
-                efficiency_emoji = {'high': '⚡', 'medium': '⚖️', 'low': '🐌'}
-                st.metric(
-                    "Efficiency", 
-                    f"{efficiency_emoji.get(efficiency)} {efficiency.title()}"
-                )
-            
-            with col4:
-                follow_up = insights.get('followUpNeeded', False)
-                st.metric(
-                    "Follow-up Needed", 
-                    "✅ Yes" if follow_up else "❌ No"
-                )
+            engagement = insights.get('engagementLevel', 'medium')
+            engagement_emoji = {'high': '🔥', 'medium': '📊', 'low': '📉'}
+            efficiency = insights.get('meetingEfficiency', 'medium')
+            efficiency_emoji = {'high': '⚡', 'medium': '⚖️', 'low': '🐌'}
+            follow_up = insights.get('followUpNeeded', False)
+            render_metric_cards([
+                ("Participation Score", f"{insights.get('participationScore', 0)}/10"),
+                ("Engagement", f"{engagement_emoji.get(engagement)} {engagement.title()}"),
+                ("Efficiency", f"{efficiency_emoji.get(efficiency)} {efficiency.title()}"),
+                ("Follow-up Needed", "✅ Yes" if follow_up else "❌ No")
+            ])
             
             # Detailed metrics
             if insights.get('keyMetrics'):
                 metrics = insights['keyMetrics']
                 st.subheader("Detailed Metrics")
                 
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Word Count", f"{metrics.get('wordCount', 0):,}")
-                with col2:
-                    st.metric("Speaking Rate", f"{metrics.get('estimatedSpeakingRate', 0)} WPM")
-                with col3:
-                    st.metric("Participants", metrics.get('participantCount', 0))
+                render_metric_cards([
+                    ("Word Count", f"{metrics.get('wordCount', 0):,}"),
+                    ("Speaking Rate", f"{metrics.get('estimatedSpeakingRate', 0)} WPM"),
+                    ("Participants", metrics.get('participantCount', 0))
+                ])
         else:
             st.info("Meeting insights not available")
 
-def display_real_time_progress(transcription_id: str):
-    """Enhanced real-time progress with summarization stages"""
-    st.subheader("⚡ Real-time Processing Pipeline")
+# Stages reported while the summarizer analyses a finished transcript
+ANALYSIS_STEPS = [
+    "Generating meeting summary...",
+    "Extracting action items...", 
+    "Identifying key topics...",
+    "Analyzing sentiment...",
+    "Extracting decisions...",
+    "Generating insights...",
+    "Finalizing analysis..."
+]
+
+def simulated_pipeline_progress(elapsed: float):
+    """(stage, percent, message) of the demo processing pipeline `elapsed` seconds in"""
+    transcription_time = 3.0  # Fast demo
+    if elapsed < transcription_time:
+        percent = int(elapsed / transcription_time * 100)
+        return "transcription", percent, f"Transcribing audio... {percent}% complete"
+    
+    step = int((elapsed - transcription_time) / 0.8)  # Slower for effect
+    if step >= len(ANALYSIS_STEPS):
+        return "completed", 100, "🎉 Complete meeting intelligence ready!"
+    return "analysis", int((step + 1) / len(ANALYSIS_STEPS) * 100), ANALYSIS_STEPS[step]
+
+def get_pipeline_progress(filename: str, started_at: float, timeout: float = 120.0):
+    """Current (stage, percent, message) of a file in the Motia pipeline
+
+    Reads the file's latest record in the backend's recent activity, so the
+    progress bars move when Motia reports progress rather than on a timer.
+    Falls back to the simulated pipeline if the backend does not report the file.
+    """
+    elapsed = time.time() - started_at
+    status_data = fetch_motia_status() or {}
+    records = [
+        item for item in status_data.get('recentActivity', [])
+        if item.get('filename') == filename
+    ]
     
-    # Create progress containers
-    transcription_progress = st.empty()
-    summarization_progress = st.empty()
-    status_text = st.empty()
+    if not records:
+        return simulated_pipeline_progress(elapsed)
     
-    # Simulate transcription progress
-    with transcription_progress:
-        st.write("**Stage 1: Audio Transcription**")
-        progress_bar = st.progress(0)
-        
-        for i in range(101):
-            progress_bar.progress(i)
-            status_text.text(f"Transcribing audio... {i}% complete")
-            time.sleep(0.03)  # Fast demo
+    latest = max(records, key=lambda item: item.get('timestamp', ''))
+    status = latest.get('status')
+    progress = int(latest.get('progress', 0))
+    message = latest.get('localWhisperStatus') or f"{status.title()}..."
+    
+    if status == 'failed':
+        return "failed", progress, message
+    if status == 'completed' and latest.get('hasSummary'):
+        return "completed", 100, message
+    if elapsed > timeout:
+        return "failed", progress, "Timed out waiting for the Motia pipeline"
+    if status == 'completed':
+        # The processor's completion only ends transcription; the summarizer
+        # has not reported yet
+        return "analysis", 0, message
+    if status == 'processing':
+        return "analysis", 50, message
+    return "transcription", progress, message
+
+@st.fragment(run_every="1s")
+def display_real_time_progress(filename: str):
+    """Enhanced real-time progress with summarization stages
+
+    Reruns on its own every second while the pipeline is running; once it
+    finishes, the outcome is stored in session state and the whole app reruns
+    so main() can render the summary.
+    """
+    st.subheader("⚡ Real-time Processing Pipeline")
+    
+    transcription = st.session_state.active_transcription
+    stage, percent, message = get_pipeline_progress(filename, transcription["started_at"])
     
-    transcription_progress.success("✅ Transcription completed!")
+    if stage in ("completed", "failed"):
+        transcription["stage"] = stage
+        transcription["message"] = message
+        st.rerun()
     
-    # Simulate summarization progress  
-    with summarization_progress:
+    st.write("**Stage 1: Audio Transcription**")
+    if stage == "transcription":
+        st.progress(percent)
+    else:
+        st.success("✅ Transcription completed!")
         st.write("**Stage 2: AI Analysis & Summarization**")
-        
-        analysis_steps = [
-            "Generating meeting summary...",
-            "Extracting action items...", 
-            "Identifying key topics...",
-            "Analyzing sentiment...",
-            "Extracting decisions...",
-            "Generating insights...",
-            "Finalizing analysis..."
-        ]
-        
-        analysis_progress = st.progress(0)
-        for i, step in enumerate(analysis_steps):
-            progress = int((i + 1) / len(analysis_steps) * 100)
-            analysis_progress.progress(progress)
-            status_text.text(step)
-            time.sleep(0.8)  # Slower for effect
-    
-    summarization_progress.success("✅ AI Analysis completed!")
-    status_text.success("🎉 Complete meeting intelligence ready!")
+        st.progress(percent)
+    st.text(message)
+
+def display_transcription_outcome(transcription: dict):
+    """Show the finished pipeline stages and the meeting summary"""
+    st.subheader("⚡ Real-time Processing Pipeline")
+    
+    if transcription["stage"] == "failed":
+        st.error(f"❌ {transcription['message']}")
+        return
+    
+    st.success("✅ Transcription completed!")
+    st.success("✅ AI Analysis completed!")
+    st.success("🎉 Complete meeting intelligence ready!")
+    
+    # Simulate final results with comprehensive summary
+    st.markdown("---")
+    # Display comprehensive summary
+    display_comprehensive_summary(get_mock_summary_data())
 
 def main():
     """Main application function"""
     
+    inject_css(CUSTOM_CSS)
+    
     # Header
     st.markdown("""
     <div class="main-header">
@@ -458,15 +623,7 @@ def main():
             st.success(f"📎 {len(uploaded_files)} file(s) selected")
             
             # Show file details
-            file_details = []
-            for file in uploaded_files:
-                file_details.append({
-                    "Name": file.name,
-                    "Size": f"{file.size / 1024 / 1024:.1f} MB",
-                    "Type": file.type
-                })
-            
-            st.dataframe(pd.DataFrame(file_details))
+            st.dataframe(get_upload_details(uploaded_files), hide_index=True)
     
     with col2:
         st.header("🚀 Motia AI Processing")
@@ -480,76 +637,32 @@ def main():
                     # Start transcription via Motia API
                     result = start_transcription_via_motia(first_file.name)
                     
-                    if result:
-                        st.success("✅ Motia AI pipeline started!")
-                        st.json(result)
-                        
-                        # Show enhanced real-time progress
-                        if 'transcriptionId' in result:
-                            display_real_time_progress(result['transcriptionId'])
-                            
-                            # Simulate final results with comprehensive summary
-                            st.markdown("---")
-                            mock_summary_data = {
-                                'summary': """
-📋 **Meeting Summary:**
-This 15-minute team standup meeting covered project progress and upcoming milestones. The team discussed current sprint status, identified blockers, and planned next steps for the product launch.
-
-🎯 **Key Outcomes:**
-• Sprint progress is on track with 80% completion
-• Two technical blockers identified and assigned
-• Product launch timeline confirmed for next month
-• Team coordination improved with new processes
-
-💡 **Overall Assessment:**
-The meeting was highly productive with clear action items and strong team engagement.
-                                """,
-                                'actionItems': [
-                                    'John: Resolve database performance issue by Friday',
-                                    'Sarah: Complete user testing scenarios by Tuesday', 
-                                    'Mike: Update deployment scripts by Thursday',
-                                    'Team: Review final designs in tomorrow\'s meeting'
-                                ],
-                                'keyTopics': [
-                                    'Project Management',
-                                    'Technology',
-                                    'Team Coordination',
-                                    'Quality Assurance'
-                                ],
-                                'sentimentAnalysis': {
-                                    'overall': 'positive',
-                                    'confidence': 0.85,
-                                    'positiveIndicators': 8,
-                                    'negativeIndicators': 2,
-                                    'energyLevel': 'high'
-                                },
-                                'decisions': [
-                                    'Approved moving to production deployment next Friday',
-                                    'Agreed to implement new code review process',
-                                    'Decided to add two more testing scenarios'
-                                ],
-                                'insights': {
-                                    'participationScore': 9,
-                                    'engagementLevel': 'high',
-                                    'meetingEfficiency': 'high',
-                                    'followUpNeeded': True,
-                                    'keyMetrics': {
-                                        'wordCount': 2456,
-                                        'estimatedSpeakingRate': 165,
-                                        'participantCount': 4
-                                    }
-                                }
-                            }
-                            
-                            # Display comprehensive summary
-                            display_comprehensive_summary(mock_summary_data)
+                st.session_state.active_transcription = result and {
+                    "result": result,
+                    "filename": first_file.name,
+                    "started_at": time.time(),
+                    "stage": None,
+                    "message": None
+                }
+                if not result:
+                    st.error("❌ Failed to start transcription")
+            
+            transcription = st.session_state.get("active_transcription")
+            if transcription:
+                st.success("✅ Motia AI pipeline started!")
+                st.json(transcription["result"])
+                
+                # Show enhanced real-time progress
+                if 'transcriptionId' in transcription["result"]:
+                    if transcription["stage"] is None:
+                        display_real_time_progress(transcription["filename"])
                     else:
-                        st.error("❌ Failed to start transcription")
+                        display_transcription_outcome(transcription)
                         
             # API Testing Section
             st.subheader("🔧 API Testing")
             if st.button("Test Motia Hello Endpoint"):
-                status = get_motia_status()
+                status = probe_motia_status()
                 if status:
                     st.json(status)
                 else:
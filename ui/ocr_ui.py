@@ -11,9 +11,25 @@ import subprocess
 import os
 import pandas as pd
 import time
+import shutil
 from pathlib import Path
 import json
+import signal
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from _common import get_upload_details, inject_css
+
+# Outputs written by the Motia OCR flow
+RESULTS_CSV = Path("outputs/invoice_data.csv")
+RESULTS_HTML = Path("outputs/invoice_summary.html")
+
+# Rows of extracted data shown per page of the results table
+RESULTS_PAGE_SIZE = 50
+
+# Seconds the OCR flow may run before it is killed
+PIPELINE_TIMEOUT = 300
 
 # Page configuration
 st.set_page_config(
@@ -24,7 +40,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #e74c3c 0%, #c0392b 100%);
@@ -71,7 +87,7 @@ st.markdown("""
         margin: 0.5rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 def create_directories():
     """Ensure required directories exist"""
@@ -91,75 +107,261 @@ def save_uploaded_files(uploaded_files):
     for uploaded_file in uploaded_files:
         if uploaded_file is not None:
             file_path = input_dir / uploaded_file.name
+            uploaded_file.seek(0)
             with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
+                shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
             saved_files.append(str(file_path))
     
     return saved_files
 
-def run_motia_pipeline():
-    """Run the Motia OCR pipeline"""
+def kill_process_group(process):
+    """Kill a pipeline process together with any workers it spawned"""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+def run_motia_pipeline(on_output=None):
+    """Run the Motia OCR pipeline
+
+    stdout is read line by line while the flow runs and each line is passed
+    to `on_output`, so the UI can show progress instead of waiting for exit.
+    """
     try:
-        # Run the Motia flow
-        result = subprocess.run(
+        # Run the Motia flow in its own process group so its workers can be
+        # killed with it
+        process = subprocess.Popen(
             ["motia", "run", "flows/flow_invoice_ocr.yml"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=300  # 5 minute timeout
+            bufsize=1,
+            start_new_session=True
         )
-        
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return False, "", "Pipeline timed out after 5 minutes"
     except FileNotFoundError:
         return False, "", "Motia CLI not found. Please install Motia first."
     except Exception as e:
         return False, "", str(e)
-
-def load_results():
-    """Load and display results"""
-    csv_file = Path("outputs/invoice_data.csv")
-    html_file = Path("outputs/invoice_summary.html")
     
+    # Kill the flow if it outlives the timeout, which also ends the stdout loop
+    timed_out = threading.Event()
+    
+    def on_timeout():
+        timed_out.set()
+        kill_process_group(process)
+    
+    timer = threading.Timer(PIPELINE_TIMEOUT, on_timeout)
+    timer.start()
+    stdout_lines = []
+    # Drain stderr concurrently so a full pipe cannot stall the flow
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stderr_future = executor.submit(process.stderr.read)
+        try:
+            for line in process.stdout:
+                stdout_lines.append(line)
+                if on_output:
+                    on_output(line.rstrip())
+            stderr = stderr_future.result()
+            returncode = process.wait()
+        except BaseException:
+            # e.g. Streamlit stopping the script mid-run: don't leave the flow
+            # running, or the executor would wait on its stderr forever
+            kill_process_group(process)
+            process.wait()
+            raise
+        finally:
+            timer.cancel()
+    
+    stdout = "".join(stdout_lines)
+    if timed_out.is_set():
+        return False, stdout, f"Pipeline timed out after {PIPELINE_TIMEOUT} seconds"
+    return returncode == 0, stdout, stderr
+
+def file_mtime(path: Path):
+    """Modification time of a file, or None if it does not exist"""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_results(csv_mtime, html_mtime):
+    """Read the pipeline outputs
+
+    The mtimes are only cache keys: results are re-read when the pipeline
+    rewrites its outputs, not on every rerun.
+    """
     results = {}
     
-    if csv_file.exists():
+    if csv_mtime is not None:
         try:
-            df = pd.read_csv(csv_file)
+            # raw_text can be large and is only shown for one invoice at a
+            # time, so it is read on demand by get_raw_text
+            df = pd.read_csv(RESULTS_CSV, usecols=lambda column: column != 'raw_text')
             results['csv'] = df
+            results['csv_mtime'] = csv_mtime
         except Exception as e:
             st.error(f"Error reading CSV: {e}")
     
-    if html_file.exists():
-        results['html'] = str(html_file)
+    if html_mtime is not None:
+        results['html'] = RESULTS_HTML.read_text(encoding='utf-8')
     
     return results
 
+def load_results():
+    """Load and display results"""
+    return read_results(file_mtime(RESULTS_CSV), file_mtime(RESULTS_HTML))
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_csv_bytes(csv_mtime):
+    """The results CSV as written by the pipeline, for download"""
+    return RESULTS_CSV.read_bytes()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_raw_texts(csv_mtime):
+    """Extracted text of every invoice, read from the results CSV once per change"""
+    texts = pd.read_csv(RESULTS_CSV, usecols=lambda column: column == 'raw_text')
+    if 'raw_text' not in texts.columns:
+        return []
+    return texts['raw_text'].tolist()
+
+def get_raw_text(csv_mtime, row):
+    """Extracted text of one invoice"""
+    raw_texts = read_raw_texts(csv_mtime)
+    return raw_texts[row] if row < len(raw_texts) else 'No text available'
+
 def display_metrics(df):
     """Display summary metrics"""
     if df is None or df.empty:
         return
     
+    # Look the amount column up once for both aggregates
+    amounts = df['total_amount'] if 'total_amount' in df.columns else None
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Invoices Processed", len(df))
     
     with col2:
-        total_amount = df['total_amount'].sum() if 'total_amount' in df.columns else 0
+        total_amount = amounts.sum() if amounts is not None else 0
         st.metric("Total Amount", f"${total_amount:,.2f}")
     
     with col3:
-        avg_amount = df['total_amount'].mean() if 'total_amount' in df.columns else 0
+        avg_amount = amounts.mean() if amounts is not None else 0
         st.metric("Average Amount", f"${avg_amount:,.2f}")
     
     with col4:
         unique_vendors = df['vendor_name'].nunique() if 'vendor_name' in df.columns else 0
         st.metric("Unique Vendors", unique_vendors)
 
+@st.fragment
+def display_results(results):
+    """Display extracted data, downloads and the summary report
+
+    Runs as a fragment, so the download buttons rerun only this section.
+    """
+    df = results['csv']
+    
+    # Display metrics
+    display_metrics(df)
+    
+    # Display data, one page at a time for large result sets
+    st.subheader("📋 Extracted Invoice Data")
+    page_count = -(-len(df) // RESULTS_PAGE_SIZE)
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+    start = (page - 1) * RESULTS_PAGE_SIZE
+    st.dataframe(df.iloc[start:start + RESULTS_PAGE_SIZE], use_container_width=True)
+    
+    # Download options
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # CSV download
+        st.download_button(
+            label="📥 Download CSV",
+            data=read_csv_bytes(results['csv_mtime']),
+            file_name=f"invoice_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        # HTML summary
+        if 'html' in results:
+            html_content = results['html']
+            
+            st.download_button(
+                label="📄 Download HTML Summary",
+                data=html_content,
+                file_name=f"invoice_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
+                mime="text/html"
+            )
+            
+            # Display HTML summary
+            st.subheader("📄 Summary Report Preview")
+            st.components.v1.html(html_content, height=600, scrolling=True)
+
+@st.fragment
+def display_invoice_details(df, csv_mtime):
+    """Display the details of one selected invoice
+
+    Runs as a fragment, so picking another invoice reruns only this section.
+    """
+    # The pipeline rewrote the results since this fragment was drawn: rerun the
+    # whole app so the rows and their raw text come from the same file
+    if file_mtime(RESULTS_CSV) != csv_mtime:
+        st.rerun()
+    
+    st.subheader("🔍 Invoice Details")
+    
+    # Select by row position so the lookup is a direct iloc, not a column scan
+    filenames = df['filename'].tolist()
+    selected_row = st.selectbox(
+        "Select an invoice to view details:",
+        range(len(filenames)),
+        format_func=filenames.__getitem__
+    )
+    
+    if selected_row is not None:
+        invoice_data = df.iloc[selected_row]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**📅 Invoice Date**")
+            st.write(invoice_data.get('date', 'Not extracted'))
+            
+            st.markdown("**💰 Total Amount**")
+            amount = invoice_data.get('total_amount', 'Not extracted')
+            if amount and amount != 'Not extracted':
+                st.write(f"${amount:,.2f}")
+            else:
+                st.write(amount)
+            
+            st.markdown("**🏢 Vendor Name**")
+            st.write(invoice_data.get('vendor_name', 'Not extracted'))
+        
+        with col2:
+            st.markdown("**🔢 Invoice Number**")
+            st.write(invoice_data.get('invoice_number', 'Not extracted'))
+            
+            st.markdown("**💱 Currency**")
+            st.write(invoice_data.get('currency', 'Not extracted'))
+            
+            st.markdown("**📄 Raw Text**")
+            raw_text = get_raw_text(csv_mtime, selected_row)
+            st.text_area("Extracted Text", raw_text, height=200, disabled=True)
+
 def main():
     """Main application function"""
     
+    inject_css(CUSTOM_CSS)
+    
     # Header
     st.markdown("""
     <div class="main-header">
@@ -189,9 +391,13 @@ def main():
         
         # System info
         st.subheader("ℹ️ System Info")
-        st.info(f"Engine: {ocr_engine}")
-        st.info("Platform: Local Processing")
-        st.info("Privacy: 100% Offline")
+        st.markdown(f"""
+        <div class="status-box info-box">
+            Engine: {ocr_engine}<br>
+            Platform: Local Processing<br>
+            Privacy: 100% Offline
+        </div>
+        """, unsafe_allow_html=True)
     
     # Main content area
     col1, col2 = st.columns([2, 1])
@@ -211,128 +417,60 @@ def main():
             st.success(f"📎 {len(uploaded_files)} file(s) selected")
             
             # Show file details
-            file_details = []
-            for file in uploaded_files:
-                file_details.append({
-                    "Name": file.name,
-                    "Size": f"{file.size / 1024 / 1024:.1f} MB",
-                    "Type": file.type
-                })
-            
-            st.dataframe(pd.DataFrame(file_details))
+            st.dataframe(get_upload_details(uploaded_files), hide_index=True)
     
     with col2:
         st.header("🚀 Process")
         
         if uploaded_files:
             if st.button("🎯 Start OCR Processing", type="primary"):
-                with st.spinner("Processing documents..."):
+                with st.status("Processing documents...", expanded=True) as status:
                     # Save uploaded files
                     saved_files = save_uploaded_files(uploaded_files)
                     
-                    # Run pipeline
-                    success, stdout, stderr = run_motia_pipeline()
+                    # Run pipeline, showing the tail of its output as it runs
+                    output_log = st.empty()
+                    output_tail = deque(maxlen=20)
+                    
+                    def show_output(line):
+                        output_tail.append(line)
+                        output_log.code("\n".join(output_tail))
+                    
+                    success, stdout, stderr = run_motia_pipeline(show_output)
+                    status.update(
+                        label="Processing finished" if success else "Processing failed",
+                        state="complete" if success else "error",
+                        expanded=False
+                    )
+                
+                if success:
+                    st.success("✅ Processing completed successfully!")
+                    st.session_state.processing_complete = True
+                else:
+                    st.error("❌ Processing failed")
+                    st.error(f"Error: {stderr}")
                     
-                    if success:
-                        st.success("✅ Processing completed successfully!")
-                        st.session_state.processing_complete = True
-                    else:
-                        st.error("❌ Processing failed")
-                        st.error(f"Error: {stderr}")
-                        
-                        # Show detailed output for debugging
-                        with st.expander("Debug Information"):
-                            st.text("STDOUT:")
-                            st.code(stdout)
-                            st.text("STDERR:")
-                            st.code(stderr)
+                    # Show detailed output for debugging
+                    with st.expander("Debug Information"):
+                        st.text("STDOUT:")
+                        st.code(stdout)
+                        st.text("STDERR:")
+                        st.code(stderr)
         else:
             st.info("📁 Please upload invoice documents to begin")
     
     # Results section
-    if st.session_state.get('processing_complete', False) or Path("outputs/invoice_data.csv").exists():
+    if st.session_state.get('processing_complete', False) or RESULTS_CSV.exists():
         st.header("📊 Results")
         
         results = load_results()
         
         if 'csv' in results:
-            df = results['csv']
-            
-            # Display metrics
-            display_metrics(df)
-            
-            # Display data
-            st.subheader("📋 Extracted Invoice Data")
-            st.dataframe(df, use_container_width=True)
-            
-            # Download options
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # CSV download
-                csv_data = df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=csv_data,
-                    file_name=f"invoice_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            
-            with col2:
-                # HTML summary
-                if 'html' in results:
-                    with open(results['html'], 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                    
-                    st.download_button(
-                        label="📄 Download HTML Summary",
-                        data=html_content,
-                        file_name=f"invoice_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-                        mime="text/html"
-                    )
-                    
-                    # Display HTML summary
-                    st.subheader("📄 Summary Report Preview")
-                    st.components.v1.html(html_content, height=600, scrolling=True)
+            display_results(results)
         
         # Individual invoice details
         if 'csv' in results and not results['csv'].empty:
-            st.subheader("🔍 Invoice Details")
-            
-            selected_invoice = st.selectbox(
-                "Select an invoice to view details:",
-                results['csv']['filename'].tolist()
-            )
-            
-            if selected_invoice:
-                invoice_data = results['csv'][results['csv']['filename'] == selected_invoice].iloc[0]
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**📅 Invoice Date**")
-                    st.write(invoice_data.get('date', 'Not extracted'))
-                    
-                    st.markdown("**💰 Total Amount**")
-                    amount = invoice_data.get('total_amount', 'Not extracted')
-                    if amount and amount != 'Not extracted':
-                        st.write(f"${amount:,.2f}")
-                    else:
-                        st.write(amount)
-                    
-                    st.markdown("**🏢 Vendor Name**")
-                    st.write(invoice_data.get('vendor_name', 'Not extracted'))
-                
-                with col2:
-                    st.markdown("**🔢 Invoice Number**")
-                    st.write(invoice_data.get('invoice_number', 'Not extracted'))
-                    
-                    st.markdown("**💱 Currency**")
-                    st.write(invoice_data.get('currency', 'Not extracted'))
-                    
-                    st.markdown("**📄 Raw Text**")
-                    raw_text = invoice_data.get('raw_text', 'No text available')
-                    st.text_area("Extracted Text", raw_text, height=200, disabled=True)
+            display_invoice_details(results['csv'], results['csv_mtime'])
     
     # Footer
     st.markdown("---")